@@ -1,15 +1,20 @@
 import logging
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from functools import lru_cache
 
+from app.core.config import config
 from app.db.session import get_db
 from app.repositories.vehicle_repository import VehicleRepository
 from app.services.vehicle_service import VehicleService
 from app.services.vector_service import VectorService
 from app.services.embedding_service import EmbeddingService
+from app.services.cached_embedding_service import CachedEmbeddingService
 from app.services.normalization_service import NormalizationService
 from app.services.llm_service import LLMService
+from app.services.llm_batcher import LLMBatcher
 from app.schemas.vehicle import (
     VehicleRead,
     VehicleCreate,
@@ -26,23 +31,27 @@ from app.repositories.vector_repository import VectorRepository
 
 router = APIRouter()
 
+# Built once at import so batch responses are validated in a single pass
+_FULL_BATCH_ADAPTER = TypeAdapter(list[VehicleBatchMatchResultFull])
+
 
 def get_vehicle_repo(db: Session = Depends(get_db)) -> VehicleRepository:
     return VehicleRepository(db)
 
 
+@lru_cache()
 def get_vector_repo() -> VectorRepository:
     return VectorRepository()
 
 @lru_cache()
 def get_embedding_service() -> EmbeddingService:
+    if config.embedding_cache_size > 0:
+        return CachedEmbeddingService()
     return EmbeddingService()
 
-def get_vector_service(
-    repo: VectorRepository = Depends(get_vector_repo),
-    embedding_service: EmbeddingService = Depends(get_embedding_service)
-) -> VectorService:
-    return VectorService(repo, embedding_service)
+@lru_cache()
+def get_vector_service() -> VectorService:
+    return VectorService(get_vector_repo(), get_embedding_service())
 
 @lru_cache()
 def get_normalization_service() -> NormalizationService:
@@ -52,13 +61,22 @@ def get_normalization_service() -> NormalizationService:
 def get_llm_service() -> LLMService:
     return LLMService()
 
+@lru_cache()
+def get_llm_batcher() -> LLMBatcher:
+    return LLMBatcher(
+        get_llm_service,
+        max_batch=config.llm_batch_max_size,
+        max_wait_ms=config.llm_batch_max_wait_ms
+    )
+
 def get_vehicle_service(
     repo: VehicleRepository = Depends(get_vehicle_repo),
     vector_service: VectorService = Depends(get_vector_service),
     normalization_service: NormalizationService = Depends(get_normalization_service),
-    llm_service: LLMService = Depends(get_llm_service)
+    llm_service: LLMService = Depends(get_llm_service),
+    llm_batcher: LLMBatcher = Depends(get_llm_batcher)
 ) -> VehicleService:
-    return VehicleService(repo, vector_service, normalization_service, llm_service)
+    return VehicleService(repo, vector_service, normalization_service, llm_service, llm_batcher)
 
 
 @router.get("/vehicles/{crabi_id}", response_model=VehicleRead)
@@ -69,8 +87,8 @@ def get_vehicle(crabi_id: str, service: VehicleService = Depends(get_vehicle_ser
     return vehicle
 
 @router.post("/vehicles/match", response_model=VehicleRead | VehicleMatchResponse | None)
-def match_vehicles(request: VehicleMatchRequest, service: VehicleService = Depends(get_vehicle_service)):
-    response = service.get_similar_vehicles(request.description, strict=request.strict)
+async def match_vehicles(request: VehicleMatchRequest, service: VehicleService = Depends(get_vehicle_service)):
+    response = await service.get_similar_vehicles(request.description, strict=request.strict)
     if not response:
         logging.info(f"No similar vehicles found for description: {request.description}")
         return None
@@ -78,31 +96,39 @@ def match_vehicles(request: VehicleMatchRequest, service: VehicleService = Depen
         return response
     return VehicleMatchResponse(id_crabi=response.id_crabi)
 
-@router.post("/vehicles/match/batch", response_model=list[VehicleBatchMatchResultFull] | list[VehicleBatchMatchResultSimple])
-def match_vehicles_batch(request: VehicleBatchMatchRequest, service: VehicleService = Depends(get_vehicle_service)):
-    results = []
-    for description in request.descriptions:
-        vehicle = service.get_similar_vehicles(description, strict=request.strict)
-        if request.full_response:
-            results.append(VehicleBatchMatchResultFull(
-                description=description,
-                vehicle=vehicle
-            ))
-        else:
-            results.append(VehicleBatchMatchResultSimple(
-                description=description,
-                id_crabi=vehicle.id_crabi if vehicle else None
-            ))
-    return results
+@router.post(
+    "/vehicles/match/batch",
+    response_class=ORJSONResponse,
+    responses={200: {"model": list[VehicleBatchMatchResultFull] | list[VehicleBatchMatchResultSimple]}}
+)
+async def match_vehicles_batch(request: VehicleBatchMatchRequest, service: VehicleService = Depends(get_vehicle_service)):
+    vehicles = await service.get_similar_vehicles_batch(request.descriptions, strict=request.strict)
+    if request.full_response:
+        # Vehicles are ORM rows, validated into VehicleRead by attribute access
+        results = _FULL_BATCH_ADAPTER.validate_python(
+            [
+                {"description": description, "vehicle": vehicle}
+                for description, vehicle in zip(request.descriptions, vehicles)
+            ],
+            from_attributes=True
+        )
+        return ORJSONResponse(_FULL_BATCH_ADAPTER.dump_python(results))
+    # Trusted server-side data, serialized as-is
+    return ORJSONResponse([
+        {"description": description, "id_crabi": vehicle.id_crabi if vehicle else None}
+        for description, vehicle in zip(request.descriptions, vehicles)
+    ])
 
 @router.post("/vehicles", response_model=VehicleRead)
 def create_vehicle(vehicle: VehicleCreate, service: VehicleService = Depends(get_vehicle_service)):
     return service.create_vehicle(vehicle.id_crabi, vehicle.description)
 
-@router.post("/vehicles/embedding", response_model=EmbeddingResponse)
+@router.post(
+    "/vehicles/embedding",
+    response_class=ORJSONResponse,
+    responses={200: {"model": EmbeddingResponse}}
+)
 def get_embedding(request: EmbeddingRequest, vector_service: VectorService = Depends(get_vector_service)):
     embedding = vector_service.calculate_embedding(request.description)
-    return EmbeddingResponse(
-        embedding=embedding,
-        dimension=len(embedding)
-    )
+    # orjson serializes the numpy array directly, skipping response_model validation
+    return ORJSONResponse({"embedding": embedding, "dimension": len(embedding)})
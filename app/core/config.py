@@ -1,6 +1,6 @@
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings
-from app.core.constants import EmbeddingModel, GeminiModel
+from app.core.constants import EmbeddingBackend, EmbeddingModel, GeminiModel
 
 load_dotenv()
 
@@ -13,22 +13,37 @@ class Config(BaseSettings):
     db_name: str = ""
     db_host: str = ""
     db_port: int = 5432
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_recycle_seconds: int = 1800
     
     # Upstash Vector configuration
     upstash_vector_rest_url: str = ""
     upstash_vector_rest_token: str = ""
+    vector_query_cache_size: int = 10_000
+    vector_query_cache_ttl_seconds: int = 300
 
     # Embedding configuration
     embedding_model: str = EmbeddingModel.LOCAL_ALL_MINILM_L6_V2.value
+    embedding_backend: str = EmbeddingBackend.TORCH.value
+    embedding_onnx_file: str = "onnx/model_qint8_avx512_vnni.onnx"
+    embedding_batch_size: int = 32
+    embedding_max_seq_length: int = 128
+    torch_num_threads: int = 2
+    embedding_cache_size: int = 10_000
+    embedding_cache_ttl_seconds: int = 3600
 
     # Gemini LLM configuration
     gemini_api_key: str = ""
     gemini_model: str = GeminiModel.GEMINI_2_5_PRO.value
+    llm_batch_max_size: int = 16
+    llm_batch_max_wait_ms: int = 25
 
     # Vehicle matching configuration
     vector_similarity_threshold: float = 0.85
     vector_similarity_threshold_best_effort: float = 0.70
     vector_top_k: int = 10
+    batch_match_concurrency: int = 8
 
     @property
     def db_url(self):
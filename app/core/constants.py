@@ -5,6 +5,11 @@ class EmbeddingModel(str, Enum):
     LOCAL_ALL_MINILM_L6_V2 = "all-MiniLM-L6-v2"
 
 
+class EmbeddingBackend(str, Enum):
+    TORCH = "torch"
+    ONNX = "onnx"
+
+
 class GeminiModel(str, Enum):
     GEMINI_2_5_PRO = "gemini-2.5-pro"
     GEMINI_2_5_FLASH_LITE = "gemini-2.5-flash-lite"
@@ -12,4 +17,5 @@ class GeminiModel(str, Enum):
     GEMINI_3_PRO_PREVIEW = "gemini-3-pro-preview"
 
 
+VALID_EMBEDDING_BACKENDS = [backend.value for backend in EmbeddingBackend]
 VALID_GEMINI_MODELS = [model.value for model in GeminiModel]
@@ -3,7 +3,13 @@ from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import config
 
-engine = create_engine(config.db_url)
+engine = create_engine(
+    config.db_url,
+    pool_size=config.db_pool_size,
+    max_overflow=config.db_max_overflow,
+    pool_pre_ping=True,
+    pool_recycle=config.db_pool_recycle_seconds,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -1,5 +1,6 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 import logging
 
 from app.api.v1 import vehicle
@@ -7,7 +8,7 @@ from app.core.config import config
 from app.core.logging import setup_logging
 from app.db.session import engine
 from app.models.base import Base
-from app.api.v1.vehicle import get_embedding_service
+from app.api.v1.vehicle import get_embedding_service, get_llm_batcher, get_vector_repo
 
 setup_logging()
 logger = logging.getLogger(__name__)
@@ -18,12 +19,16 @@ Base.metadata.create_all(bind=engine)
 async def lifespan(app: FastAPI):
     # Startup: Load the embedding model
     logger.info("Loading embedding model...")
-    get_embedding_service()
+    # Warm up so the first request doesn't pay for lazy kernel/tokenizer initialization
+    get_embedding_service().embed_documents(["warmup"])
     logger.info("Embedding model loaded successfully.")
+    await get_llm_batcher().start()
     yield
-    # Shutdown logic (if any) can go here
+    # Shutdown: Flush pending LLM batches and release pooled connections
+    await get_llm_batcher().stop()
+    await get_vector_repo().close()
 
-app = FastAPI(title=config.app_name, lifespan=lifespan)
+app = FastAPI(title=config.app_name, lifespan=lifespan, default_response_class=ORJSONResponse)
 
 
 # Register routes
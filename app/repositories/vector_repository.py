@@ -1,6 +1,12 @@
+import hashlib
+import struct
+import threading
 from typing import Any, TypedDict
 
-import requests
+import httpx
+import numpy as np
+import orjson
+from cachetools import TTLCache
 
 from app.core.config import config
 
@@ -22,26 +28,76 @@ class VectorRepository:
         timeout: float = 30.0
     ):
         self.base_url = config.upstash_vector_rest_url.rstrip('/')
+        self._query_url = f"{self.base_url}/query"
         self.timeout = timeout
-
-    @property
-    def headers(self) -> dict[str, str]:
-        return {
+        self._headers = {
             "Authorization": f"Bearer {config.upstash_vector_rest_token}",
             "Content-Type": "application/json"
         }
+        # Repeated partner descriptions produce identical query vectors,
+        # so recent responses are reused instead of hitting Upstash again
+        self._query_cache: TTLCache[str, VectorQueryResponse] = TTLCache(
+            maxsize=config.vector_query_cache_size,
+            ttl=config.vector_query_cache_ttl_seconds
+        )
+        self._query_cache_lock = threading.Lock()
+        # Reuse keep-alive TCP/TLS connections to Upstash across queries
+        self._client = httpx.AsyncClient(
+            headers=self._headers,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        )
+
+    async def close(self) -> None:
+        await self._client.aclose()
 
-    def query(
+    def _query_cache_key(
         self,
-        vector: list[float],
+        vector: np.ndarray,
+        top_k: int,
+        include_metadata: bool,
+        include_vectors: bool,
+        filter: str | None,
+        namespace: str | None
+    ) -> str:
+        digest = hashlib.blake2b(np.ascontiguousarray(vector, dtype=np.float32).tobytes(), digest_size=16)
+        digest.update(struct.pack("<I??", top_k, include_metadata, include_vectors))
+        digest.update(f"{filter or ''}\0{namespace or ''}".encode())
+        return digest.hexdigest()
+
+    async def query(
+        self,
+        vector: np.ndarray,
         top_k: int = 10,
         include_metadata: bool = True,
         include_vectors: bool = False,
         filter: str | None = None,
         namespace: str | None = None
     ) -> VectorQueryResponse:
-        url = f"{self.base_url}/query"
-        
+        cache_key = self._query_cache_key(
+            vector, top_k, include_metadata, include_vectors, filter, namespace
+        )
+        with self._query_cache_lock:
+            cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = await self._query(vector, top_k, include_metadata, include_vectors, filter, namespace)
+
+        if config.vector_query_cache_size > 0:
+            with self._query_cache_lock:
+                self._query_cache[cache_key] = result
+        return result
+
+    async def _query(
+        self,
+        vector: np.ndarray,
+        top_k: int,
+        include_metadata: bool,
+        include_vectors: bool,
+        filter: str | None,
+        namespace: str | None
+    ) -> VectorQueryResponse:
         payload: dict[str, Any] = {
             "vector": vector,
             "topK": top_k,
@@ -54,13 +110,11 @@ class VectorRepository:
         if namespace:
             payload["namespace"] = namespace
 
-        response = requests.post(
-            url,
-            json=payload,
-            headers=self.headers,
-            timeout=self.timeout
+        # orjson serializes the float32 array directly, without a list round-trip
+        response = await self._client.post(
+            self._query_url,
+            content=orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
         )
 
         response.raise_for_status()
-        return response.json()
-
+        return orjson.loads(response.content)
@@ -1,3 +1,6 @@
+from typing import Any
+
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from app.models.vehicle import Vehicle
@@ -9,7 +12,9 @@ class VehicleRepository(BaseRepository[Vehicle]):
         super().__init__(Vehicle, db)
 
     def get_by_crabi_id(self, crabi_id: str) -> Vehicle | None:
-        return self.db.query(self.model).filter(self.model.id_crabi == crabi_id).first()
+        return self.db.execute(
+            select(self.model).where(self.model.id_crabi == crabi_id)
+        ).scalar_one_or_none()
 
     def get_by_crabi_ids(self, crabi_ids: list[str]) -> list[Vehicle]:
         """
@@ -23,10 +28,35 @@ class VehicleRepository(BaseRepository[Vehicle]):
         """
         if not crabi_ids:
             return []
-        return self.db.query(self.model).filter(self.model.id_crabi.in_(crabi_ids)).all()
+        return self.db.execute(
+            select(self.model).where(self.model.id_crabi.in_(crabi_ids))
+        ).scalars().all()
 
     def create_vehicle(self, vehicle: Vehicle) -> Vehicle:
         self.db.add(vehicle)
         self.db.commit()
         self.db.refresh(vehicle)
-        return vehicle
\ No newline at end of file
+        return vehicle
+
+    def bulk_create(self, items: list[dict[str, Any]]) -> list[Vehicle]:
+        """
+        Insert multiple vehicles with a single executemany INSERT ... RETURNING.
+        
+        Args:
+            items: List of dicts with 'id_crabi' and 'description' keys
+            
+        Returns:
+            List of the created Vehicle objects, in the same order as items
+        """
+        if not items:
+            return []
+        vehicles = self.db.scalars(
+            insert(self.model).returning(self.model, sort_by_parameter_order=True),
+            items
+        ).all()
+        # Detach the fully loaded rows so commit doesn't expire them, which
+        # would refresh each one with its own SELECT when serialized
+        for vehicle in vehicles:
+            self.db.expunge(vehicle)
+        self.db.commit()
+        return vehicles
@@ -0,0 +1,95 @@
+import hashlib
+import logging
+import threading
+
+import numpy as np
+from cachetools import TTLCache
+
+from app.core.config import config
+from app.services.embedding_service import EmbeddingService
+
+logger = logging.getLogger(__name__)
+
+
+class CachedEmbeddingService(EmbeddingService):
+    """
+    EmbeddingService with a content-addressed cache in front of the model.
+
+    Partner descriptions are highly repetitive, so embeddings are cached under
+    blake2b(model_name + text) and stored as compact float32 bytes. A cache hit
+    replaces a transformer forward pass with a hash lookup.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._cache: TTLCache[bytes, bytes] = TTLCache(
+            maxsize=config.embedding_cache_size,
+            ttl=config.embedding_cache_ttl_seconds
+        )
+        self._lock = threading.Lock()
+
+    def _cache_key(self, text: str) -> bytes:
+        return hashlib.blake2b(f"{self.model_name}\0{text}".encode(), digest_size=16).digest()
+
+    def _get_cached(self, key: bytes) -> np.ndarray | None:
+        with self._lock:
+            value = self._cache.get(key)
+        if value is None:
+            return None
+        # Read-only view over the cached bytes, no copy
+        return np.frombuffer(value, dtype=np.float32)
+
+    def _set_cached(self, key: bytes, embedding: np.ndarray) -> None:
+        value = np.ascontiguousarray(embedding, dtype=np.float32).tobytes()
+        with self._lock:
+            self._cache[key] = value
+
+    def calculate_embedding(self, text: str) -> np.ndarray:
+        """
+        Calculates the embedding for a given text string, using the cache when possible.
+        """
+        if not text:
+            return np.empty(0, dtype=np.float32)
+
+        key = self._cache_key(text)
+        cached = self._get_cached(key)
+        if cached is not None:
+            logger.debug("Embedding cache hit")
+            return cached
+
+        embedding = super().calculate_embedding(text)
+        self._set_cached(key, embedding)
+        return embedding
+
+    def embed_documents(self, texts: list[str]) -> np.ndarray:
+        """
+        Calculates the embeddings for several texts, only sending cache misses to the model.
+        """
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+
+        keys = [self._cache_key(text) for text in texts]
+        embeddings = np.empty((len(texts), self.dimension), dtype=np.float32)
+
+        # Deduplicate misses so repeated descriptions are embedded once
+        missing: dict[bytes, list[int]] = {}
+        missing_texts: list[str] = []
+        for index, (key, text) in enumerate(zip(keys, texts)):
+            cached = self._get_cached(key)
+            if cached is not None:
+                embeddings[index] = cached
+                continue
+            if key not in missing:
+                missing[key] = []
+                missing_texts.append(text)
+            missing[key].append(index)
+
+        logger.debug(f"Embedding cache: {len(texts) - sum(map(len, missing.values()))} hits, {len(missing)} misses")
+
+        if missing:
+            computed = super().embed_documents(missing_texts)
+            for (key, indexes), embedding in zip(missing.items(), computed):
+                self._set_cached(key, embedding)
+                embeddings[indexes] = embedding
+
+        return embeddings
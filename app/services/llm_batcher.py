@@ -0,0 +1,134 @@
+import asyncio
+import contextlib
+import logging
+from typing import Callable
+
+from app.services.llm_service import LLMService, VehicleMatchingResponse, VehicleOption
+
+logger = logging.getLogger(__name__)
+
+
+class LLMBatcher:
+    """
+    Coalesces concurrent vehicle matching requests into bulk LLM calls.
+
+    Requests submitted while a batch is being collected (until max_batch
+    requests are queued or max_wait_ms has elapsed since the first one) are
+    resolved together with a single LLMService.match_vehicles_bulk call, and
+    each caller receives its own result.
+    """
+
+    def __init__(
+        self,
+        llm_service_provider: Callable[[], LLMService],
+        max_batch: int = 16,
+        max_wait_ms: int = 25
+    ):
+        # Resolved lazily so the app can start without Gemini credentials
+        self._llm_service_provider = llm_service_provider
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        self._dispatches: set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        """Start the background task that collects and dispatches batches."""
+        if self._worker is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+        logger.info(f"LLM batcher started (max_batch={self.max_batch}, max_wait={self.max_wait * 1000:.0f}ms)")
+
+    async def stop(self) -> None:
+        """
+        Stop collecting batches and wait for in-flight LLM calls to finish.
+
+        Requests already taken into a batch are dispatched before stopping;
+        anything still queued is failed.
+        """
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._worker
+        self._worker = None
+
+        if self._dispatches:
+            await asyncio.gather(*self._dispatches, return_exceptions=True)
+
+        # Fail anything that was queued but never dispatched
+        while not self._queue.empty():
+            *_, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("LLM batcher stopped"))
+        logger.info("LLM batcher stopped")
+
+    async def submit(
+        self,
+        user_description: str,
+        options: list[VehicleOption]
+    ) -> VehicleMatchingResponse:
+        """
+        Queue a vehicle matching task and wait for its result.
+
+        Args:
+            user_description: The user's description of the vehicle they are looking for
+            options: List of vehicle options to choose from (from vector search results)
+
+        Returns:
+            VehicleMatchingResponse with selected_id (or None), confidence, and reasoning
+        """
+        if self._worker is None:
+            raise RuntimeError("LLM batcher is not running")
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((user_description, options, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            try:
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Stopped while collecting: these requests are already off the
+                # queue, so dispatch them for stop() to wait on before exiting
+                self._schedule_dispatch(batch)
+                raise
+
+            self._schedule_dispatch(batch)
+
+    def _schedule_dispatch(self, batch: list) -> None:
+        # Dispatch in the background so the next batch can be collected meanwhile
+        task = asyncio.create_task(self._dispatch(batch))
+        self._dispatches.add(task)
+        task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: list) -> None:
+        logger.info(f"Dispatching {len(batch)} coalesced vehicle matching requests")
+        try:
+            llm_service = self._llm_service_provider()
+            responses = await llm_service.match_vehicles_bulk(
+                [(user_description, options) for user_description, options, _ in batch]
+            )
+        except Exception as e:
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (*_, future), response in zip(batch, responses):
+            # The caller may have been cancelled (e.g. client disconnected)
+            if not future.done():
+                future.set_result(response)
@@ -145,6 +145,18 @@ class VehicleMatchingResponse(BaseModel):
     )
 
 
+class BulkVehicleMatchingItem(VehicleMatchingResponse):
+    """Structured response for one task of a bulk vehicle matching request."""
+    task_index: int = Field(description="The index of the task this result answers")
+
+
+class BulkVehicleMatchingResponse(BaseModel):
+    """Structured response from the LLM for several vehicle matching tasks."""
+    results: list[BulkVehicleMatchingItem] = Field(
+        description="One result per task, identified by its task index"
+    )
+
+
 class LLMService:
     """Service for interacting with Google's Gemini LLM."""
     
@@ -163,6 +175,7 @@ class LLMService:
         
         self.llm = self._initialize_llm()
         self.structured_llm = self._initialize_structured_llm()
+        self.structured_bulk_llm = self._initialize_structured_bulk_llm()
     
     def _initialize_llm(self) -> ChatGoogleGenerativeAI:
         """Initialize the base Gemini LLM with thinking mode enabled."""
@@ -183,6 +196,10 @@ class LLMService:
         """Initialize the LLM with structured output for vehicle matching."""
         return self.llm.with_structured_output(VehicleMatchingResponse)
     
+    def _initialize_structured_bulk_llm(self):
+        """Initialize the LLM with structured output for bulk vehicle matching."""
+        return self.llm.with_structured_output(BulkVehicleMatchingResponse)
+    
     def match_vehicle(
         self,
         user_description: str,
@@ -199,17 +216,53 @@ class LLMService:
             VehicleMatchingResponse with selected_id (or None), confidence, and reasoning
         """
         if not options:
-            logger.warning("No options provided for vehicle matching")
-            return VehicleMatchingResponse(
-                selected_id=None,
-                confidence=0.0,
-                reasoning="No vehicle options were provided to match against."
-            )
+            return self._no_options_response()
         
-        options_text = "\n".join([
-            f"- ID: {opt.id} → {opt.description}"
-            for opt in options
-        ])
+        try:
+            logger.info(f"Matching vehicle description against {len(options)} options")
+            response = self.structured_llm.invoke(self._build_match_messages(user_description, options))
+            self._log_match_result(response)
+            return response
+            
+        except Exception as e:
+            logger.error(f"Error during vehicle matching: {e}")
+            raise
+    
+    async def amatch_vehicle(
+        self,
+        user_description: str,
+        options: list[VehicleOption]
+    ) -> VehicleMatchingResponse:
+        """
+        Async variant of match_vehicle, awaiting the Gemini request instead of blocking a thread.
+        """
+        if not options:
+            return self._no_options_response()
+        
+        try:
+            logger.info(f"Matching vehicle description against {len(options)} options")
+            response = await self.structured_llm.ainvoke(self._build_match_messages(user_description, options))
+            self._log_match_result(response)
+            return response
+            
+        except Exception as e:
+            logger.error(f"Error during vehicle matching: {e}")
+            raise
+    
+    def _no_options_response(self) -> VehicleMatchingResponse:
+        logger.warning("No options provided for vehicle matching")
+        return VehicleMatchingResponse(
+            selected_id=None,
+            confidence=0.0,
+            reasoning="No vehicle options were provided to match against."
+        )
+    
+    def _build_match_messages(
+        self,
+        user_description: str,
+        options: list[VehicleOption]
+    ) -> list[SystemMessage | HumanMessage]:
+        options_text = self._format_options(options)
         
         user_message = f"""## DESCRIPCIÓN DEL VEHÍCULO ENVIADA POR EL PARTNER
 
@@ -225,26 +278,122 @@ Analiza la descripción del partner y determina cuál de las opciones de nuestro
 
 Retorna el ID de la opción que mejor coincida, o null si no puedes determinar con confianza cuál es el vehículo correcto (especialmente si hay ambigüedad entre versiones similares)."""
         
-        try:
-            logger.info(f"Matching vehicle description against {len(options)} options")
-            
-            messages = [
-                SystemMessage(content=VEHICLE_MATCHING_SYSTEM_PROMPT),
-                HumanMessage(content=user_message)
-            ]
-            
-            response = self.structured_llm.invoke(messages)
+        return [
+            SystemMessage(content=VEHICLE_MATCHING_SYSTEM_PROMPT),
+            HumanMessage(content=user_message)
+        ]
+    
+    def _log_match_result(self, response: VehicleMatchingResponse) -> None:
+        logger.info(
+            f"Vehicle matching result: selected_id={response.selected_id}, "
+            f"confidence={response.confidence:.2f}"
+        )
+    
+    async def match_vehicles_bulk(
+        self,
+        tasks: list[tuple[str, list[VehicleOption]]]
+    ) -> list[VehicleMatchingResponse]:
+        """
+        Resolve several (user_description, options) matching tasks with a single LLM call.
+        
+        Amortizes the network round-trip and prompt prefill of the system prompt
+        across every task of a batch. The Gemini request is awaited, so no
+        thread is held while waiting for it.
+        
+        Args:
+            tasks: List of (user_description, options) pairs
+        
+        Returns:
+            One VehicleMatchingResponse per task, in the same order as the input
+        """
+        responses: list[VehicleMatchingResponse | None] = [None] * len(tasks)
+        pending = []
+        # Identical tasks are only sent once and share the same result
+        first_index: dict[tuple, int] = {}
+        duplicate_of: dict[int, int] = {}
+        for index, (user_description, options) in enumerate(tasks):
+            if not options:
+                responses[index] = self._no_options_response()
+                continue
+            key = (user_description, tuple((opt.id, opt.description) for opt in options))
+            if key in first_index:
+                duplicate_of[index] = first_index[key]
+            else:
+                first_index[key] = index
+                pending.append(index)
+        
+        if len(pending) == 1:
+            index = pending[0]
+            responses[index] = await self.amatch_vehicle(*tasks[index])
+        elif pending:
+            tasks_text = "\n\n".join([
+                f"""### TAREA {index}
+
+Descripción del partner: "{tasks[index][0]}"
+
+Opciones disponibles:
+{self._format_options(tasks[index][1])}"""
+                for index in pending
+            ])
             
-            logger.info(
-                f"Vehicle matching result: selected_id={response.selected_id}, "
-                f"confidence={response.confidence:.2f}"
-            )
+            user_message = f"""## TAREAS DE HOMOLOGACIÓN
+
+Cada tarea contiene una descripción de vehículo enviada por un partner y las opciones disponibles en nuestro catálogo para esa descripción.
+
+{tasks_text}
+
+## TU TAREA
+
+Resuelve cada tarea de forma independiente: analiza la descripción del partner y determina cuál de las opciones de ESA tarea corresponde al mismo vehículo. Considera las variaciones de formato, sinónimos y campos redundantes o faltantes.
+
+Retorna exactamente un resultado por tarea con su número de tarea en task_index, y el ID de la opción que mejor coincida, o null si no puedes determinar con confianza cuál es el vehículo correcto (especialmente si hay ambigüedad entre versiones similares)."""
             
-            return response
+            try:
+                logger.info(f"Matching {len(pending)} vehicle descriptions in a single bulk request")
+                
+                messages = [
+                    SystemMessage(content=VEHICLE_MATCHING_SYSTEM_PROMPT),
+                    HumanMessage(content=user_message)
+                ]
+                
+                bulk_response = await self.structured_bulk_llm.ainvoke(messages)
+                
+            except Exception as e:
+                logger.error(f"Error during bulk vehicle matching: {e}")
+                raise
             
-        except Exception as e:
-            logger.error(f"Error during vehicle matching: {e}")
-            raise
+            for item in bulk_response.results:
+                if item.task_index in pending and responses[item.task_index] is None:
+                    responses[item.task_index] = VehicleMatchingResponse(
+                        selected_id=item.selected_id,
+                        confidence=item.confidence,
+                        reasoning=item.reasoning
+                    )
+        
+        for index, original_index in duplicate_of.items():
+            responses[index] = responses[original_index]
+        
+        for index, response in enumerate(responses):
+            if response is None:
+                logger.warning(f"Bulk vehicle matching returned no result for task {index}")
+                responses[index] = VehicleMatchingResponse(
+                    selected_id=None,
+                    confidence=0.0,
+                    reasoning="The LLM did not return a result for this task."
+                )
+        
+        logger.info(
+            "Bulk vehicle matching results: "
+            + ", ".join(f"{index}={response.selected_id}" for index, response in enumerate(responses))
+        )
+        
+        return responses
+    
+    def _format_options(self, options: list[VehicleOption]) -> str:
+        return "\n".join([
+            f"- ID: {opt.id} → {opt.description}"
+            for opt in options
+        ])
     
     def match_vehicle_from_dict(
         self,
@@ -1,3 +1,4 @@
+import numpy as np
 
 from app.repositories.vector_repository import VectorRepository
 from app.services.embedding_service import EmbeddingService
@@ -7,12 +8,11 @@ class VectorService:
         self.vector_repository = vector_repository
         self.embedding_service = embedding_service
 
-    def calculate_embedding(self, description: str):
+    def calculate_embedding(self, description: str) -> np.ndarray:
         return self.embedding_service.calculate_embedding(description)
 
-    def query(self, vector: list[float], top_k: int = 10):
-        return self.vector_repository.query(vector, top_k)
+    def calculate_embeddings_batch(self, descriptions: list[str]) -> np.ndarray:
+        return self.embedding_service.embed_documents(descriptions)
 
-    def query_by_description(self, description: str, top_k: int = 10):
-        vector = self.calculate_embedding(description)
-        return self.query(vector, top_k)
+    async def query(self, vector: np.ndarray, top_k: int = 10):
+        return await self.vector_repository.query(vector, top_k)
@@ -1,28 +1,43 @@
+import asyncio
 import json
 import logging
+from typing import TypedDict
+
+import numpy as np
 
 from app.core.config import config
 from app.models.vehicle import Vehicle
 from app.repositories.vehicle_repository import VehicleRepository
-from app.services.llm_service import LLMService, VehicleOption
+from app.services.llm_batcher import LLMBatcher
+from app.services.llm_service import LLMService, VehicleMatchingResponse, VehicleOption
 from app.services.normalization_service import NormalizationService
 from app.services.vector_service import VectorService
 
 logger = logging.getLogger(__name__)
 
 
+class MatchCandidates(TypedDict):
+    """Outcome of the vector search stage for a single description."""
+    # Confident match that can be returned without asking the LLM
+    match_id: str | None
+    # Candidates the LLM has to disambiguate (empty when there is nothing to verify)
+    candidate_ids: list[str]
+
+
 class VehicleService:
     def __init__(
         self,
         vehicle_repository: VehicleRepository,
         vector_service: VectorService,
         normalization_service: NormalizationService,
-        llm_service: LLMService
+        llm_service: LLMService,
+        llm_batcher: LLMBatcher
     ):
         self.vector_service = vector_service
         self.vehicle_repository = vehicle_repository
         self.normalization_service = normalization_service
         self.llm_service = llm_service
+        self.llm_batcher = llm_batcher
         self.similarity_threshold = config.vector_similarity_threshold
         self.similarity_threshold_best_effort = config.vector_similarity_threshold_best_effort
 
@@ -33,7 +48,13 @@ class VehicleService:
         vehicle = Vehicle(id_crabi=id_crabi, description=description)
         return self.vehicle_repository.create_vehicle(vehicle)
 
-    def get_similar_vehicles(self, description: str, strict: bool = False) -> Vehicle | None:
+    def create_vehicles(self, vehicles: list[tuple[str, str]]) -> list[Vehicle]:
+        return self.vehicle_repository.bulk_create([
+            {"id_crabi": id_crabi, "description": description}
+            for id_crabi, description in vehicles
+        ])
+
+    async def get_similar_vehicles(self, description: str, strict: bool = False) -> Vehicle | None:
         """
         Find the vehicle in the database that best matches the user's description.
         
@@ -43,30 +64,107 @@ class VehicleService:
         3. Filter results by confidence thresholds
         4. Apply rules based on strict mode:
            - Non-strict: Return immediately if single high-confidence match
-           - Strict: Always verify with LLM
+           - Strict: Return immediately only if the single high-confidence match
+             is the only candidate, otherwise verify with LLM
         5. If no results or LLM can't determine, return None
         
+        The LLM step goes through the LLMBatcher, so concurrent requests share
+        a single bulk LLM call.
+        
         Args:
             description: The raw vehicle description from the partner
-            strict: If True, always verify with LLM regardless of confidence
+            strict: If True, verify with LLM unless there is a single unambiguous match
             
         Returns:
             The matched Vehicle or None if no confident match is found
         """
         logger.info(f"get_similar_vehicles called with strict={strict}")
         
-        # Step 1: Normalize the description
-        normalized_description = self.normalization_service.normalize(description, full_normalization=True)
-        logger.info(f"Normalized description: '{description}' -> '{normalized_description}'")
+        # Step 1: Normalize and embed the description
+        [embedding] = await asyncio.to_thread(self.embed_descriptions, [description])
+        candidates = await self.search_candidates(embedding, strict)
+        
+        [match], pending = await asyncio.to_thread(self._load_candidate_vehicles, [candidates])
+        if not pending:
+            return match
+        
+        [(_, vehicles)] = pending
+        llm_response = await self.llm_batcher.submit(
+            user_description=description,  # Use original description for LLM
+            options=[VehicleOption(id=v.id_crabi, description=v.description) for v in vehicles]
+        )
+        return self._select_vehicle(llm_response, vehicles)
+
+    async def get_similar_vehicles_batch(
+        self,
+        descriptions: list[str],
+        strict: bool = False
+    ) -> list[Vehicle | None]:
+        """
+        Batch variant of get_similar_vehicles.
+        
+        Embeds every description in a single model call, runs the vector
+        searches concurrently and resolves everything that needs disambiguation
+        with bulk LLM calls of at most llm_batch_max_size descriptions each.
+        
+        Args:
+            descriptions: The raw vehicle descriptions from the partner
+            strict: If True, verify with LLM unless there is a single unambiguous match
+            
+        Returns:
+            The matched Vehicle or None for each description, in the same order
+        """
+        logger.info(f"get_similar_vehicles_batch called with {len(descriptions)} descriptions, strict={strict}")
+        
+        # Bound the fan-out so a large batch doesn't saturate Upstash
+        semaphore = asyncio.Semaphore(config.batch_match_concurrency)
+        
+        async def bounded_search(embedding: np.ndarray) -> MatchCandidates:
+            async with semaphore:
+                return await self.search_candidates(embedding, strict)
         
+        embeddings = await asyncio.to_thread(self.embed_descriptions, descriptions)
+        candidates = await asyncio.gather(*[bounded_search(e) for e in embeddings])
+        return await self.resolve_matches(descriptions, candidates)
+
+    def embed_descriptions(self, descriptions: list[str]) -> np.ndarray:
+        """
+        Normalize several descriptions and embed them in a single batched model call.
+        
+        Returns:
+            float32 array of shape (len(descriptions), dimension)
+        """
+        normalized_descriptions = []
+        for description in descriptions:
+            normalized_description = self.normalization_service.normalize(description, full_normalization=True)
+            logger.info(f"Normalized description: '{description}' -> '{normalized_description}'")
+            normalized_descriptions.append(normalized_description)
+        return self.vector_service.calculate_embeddings_batch(normalized_descriptions)
+
+    async def search_candidates(self, embedding: np.ndarray, strict: bool = False) -> MatchCandidates:
+        """
+        Query the vector database and apply the threshold rules (steps 2-4).
+        
+        Doesn't touch the database session, so it is safe to run for several
+        descriptions concurrently.
+        
+        Args:
+            embedding: Embedding of the normalized description
+            strict: If True, verify with LLM unless there is a single unambiguous match
+            
+        Returns:
+            MatchCandidates with either a direct match, candidates for the LLM, or neither
+        """
+        no_match = MatchCandidates(match_id=None, candidate_ids=[])
+
         # Step 2: Query vector database
-        result = self.vector_service.query_by_description(normalized_description, config.vector_top_k)
+        result = await self.vector_service.query(embedding, config.vector_top_k)
         logger.info(f"Vector search result:\n{json.dumps(result, indent=2)}")
 
         # Check if result array is empty
         if not result or not result.get('result'):
             logger.info("No similar vehicles found - empty results")
-            return None
+            return no_match
 
         # Step 3: Filter results by thresholds
         high_confidence_results = [
@@ -88,19 +186,15 @@ class VehicleService:
         all_candidates = high_confidence_results + best_effort_results
         if not all_candidates:
             logger.info("No results above best-effort threshold")
-            return None
+            return no_match
         
-        # Non-strict mode: Single high-confidence result, return immediately
-        if not strict and len(high_confidence_results) == 1:
+        # Single high-confidence result, return immediately. Strict mode only
+        # skips the LLM when there is no best-effort candidate competing with it
+        if len(high_confidence_results) == 1 and (not strict or not best_effort_results):
             id_crabi = high_confidence_results[0].get('id')
             score = high_confidence_results[0].get('score')
             logger.info(f"Single high-confidence match found: {id_crabi} with score {score}")
-            
-            vehicle = self.vehicle_repository.get_by_crabi_id(id_crabi)
-            if not vehicle:
-                logger.warning(f"Vehicle with id_crabi {id_crabi} not found in database")
-                return None
-            return vehicle
+            return MatchCandidates(match_id=id_crabi, candidate_ids=[])
         
         # Determine candidates for LLM verification
         if strict:
@@ -116,25 +210,107 @@ class VehicleService:
         
         crabi_ids = [r.get('id') for r in filtered_results]
         logger.info(f"Candidates for LLM: {crabi_ids}")
+        return MatchCandidates(match_id=None, candidate_ids=crabi_ids)
+
+    async def resolve_matches(
+        self,
+        descriptions: list[str],
+        candidates: list[MatchCandidates]
+    ) -> list[Vehicle | None]:
+        """
+        Turn the vector search outcome of each description into a Vehicle (steps 5-6).
         
-        vehicles = self.vehicle_repository.get_by_crabi_ids(crabi_ids)
-        
-        if not vehicles:
-            logger.warning("No vehicles found in database for the matched crabi_ids")
-            return None
+        Direct matches are fetched from the database. Everything that needs
+        disambiguation is sent to the LLM in bulk calls of at most
+        llm_batch_max_size descriptions, at most batch_match_concurrency at a time.
         
-        # Prepare options for LLM
-        options = [
-            VehicleOption(id=v.id_crabi, description=v.description)
-            for v in vehicles
-        ]
-        
-        # Use LLM to determine the correct vehicle
-        llm_response = self.llm_service.match_vehicle(
-            user_description=description,  # Use original description for LLM
-            options=options
-        )
+        Args:
+            descriptions: The raw vehicle descriptions from the partner
+            candidates: The search_candidates outcome for each description
+            
+        Returns:
+            The matched Vehicle or None for each description, in the same order
+        """
+        matches, pending = await asyncio.to_thread(self._load_candidate_vehicles, candidates)
+
+        if not pending:
+            return matches
+
+        # Keep each prompt bounded so a large batch can't exceed the output limit
+        chunk_size = config.llm_batch_max_size
+        chunks = [pending[start:start + chunk_size] for start in range(0, len(pending), chunk_size)]
+
+        # Bound the fan-out so a large batch doesn't trip Gemini rate limits
+        semaphore = asyncio.Semaphore(config.batch_match_concurrency)
+
+        async def bounded_match(chunk: list[tuple[int, list[Vehicle]]]) -> list[VehicleMatchingResponse]:
+            async with semaphore:
+                return await self.llm_service.match_vehicles_bulk([
+                    (
+                        descriptions[index],  # Use original description for LLM
+                        [VehicleOption(id=v.id_crabi, description=v.description) for v in vehicles]
+                    )
+                    for index, vehicles in chunk
+                ])
+
+        # Use LLM to determine the correct vehicle for every pending description
+        chunk_responses = await asyncio.gather(*[bounded_match(chunk) for chunk in chunks])
+
+        for chunk, llm_responses in zip(chunks, chunk_responses):
+            for (index, vehicles), llm_response in zip(chunk, llm_responses):
+                matches[index] = self._select_vehicle(llm_response, vehicles)
+
+        return matches
+
+    def _load_candidate_vehicles(
+        self,
+        candidates: list[MatchCandidates]
+    ) -> tuple[list[Vehicle | None], list[tuple[int, list[Vehicle]]]]:
+        """
+        Fetch direct matches and LLM candidates from the database in a single query.
         
+        Returns:
+            The direct matches (None where there is none yet), and the
+            (index, candidate vehicles) pairs that still need the LLM
+        """
+        # Fetch every id referenced by any description with a single query
+        crabi_ids = {
+            crabi_id
+            for candidate in candidates
+            for crabi_id in ([candidate['match_id']] if candidate['match_id'] else candidate['candidate_ids'])
+        }
+        vehicles_by_id = {
+            vehicle.id_crabi: vehicle
+            for vehicle in self.vehicle_repository.get_by_crabi_ids(list(crabi_ids))
+        }
+
+        matches: list[Vehicle | None] = [None] * len(candidates)
+        pending: list[tuple[int, list[Vehicle]]] = []
+
+        for index, candidate in enumerate(candidates):
+            if candidate['match_id']:
+                vehicle = vehicles_by_id.get(candidate['match_id'])
+                if not vehicle:
+                    logger.warning(f"Vehicle with id_crabi {candidate['match_id']} not found in database")
+                matches[index] = vehicle
+            elif candidate['candidate_ids']:
+                vehicles = [
+                    vehicles_by_id[crabi_id]
+                    for crabi_id in candidate['candidate_ids']
+                    if crabi_id in vehicles_by_id
+                ]
+                if not vehicles:
+                    logger.warning("No vehicles found in database for the matched crabi_ids")
+                    continue
+                pending.append((index, vehicles))
+
+        return matches, pending
+
+    def _select_vehicle(
+        self,
+        llm_response: VehicleMatchingResponse,
+        vehicles: list[Vehicle]
+    ) -> Vehicle | None:
         logger.info(
             f"LLM response: selected_id={llm_response.selected_id}, "
             f"confidence={llm_response.confidence}, "
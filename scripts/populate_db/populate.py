@@ -19,7 +19,7 @@ from dataclasses import dataclass
 from typing import Any
 
 import requests
-from langchain_huggingface import HuggingFaceEmbeddings
+from sentence_transformers import SentenceTransformer
 from sqlalchemy import create_engine, String
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, Session, sessionmaker
 
@@ -46,6 +46,7 @@ class Config:
     upstash_vector_rest_url: str
     upstash_vector_rest_token: str
     embedding_model: str
+    embedding_max_seq_length: int
     
     @classmethod
     def from_env(cls) -> "Config":
@@ -59,6 +60,7 @@ class Config:
             upstash_vector_rest_url=os.environ.get("UPSTASH_VECTOR_REST_URL", ""),
             upstash_vector_rest_token=os.environ.get("UPSTASH_VECTOR_REST_TOKEN", ""),
             embedding_model=os.environ.get("EMBEDDING_MODEL", "all-MiniLM-L6-v2"),
+            embedding_max_seq_length=int(os.environ.get("EMBEDDING_MAX_SEQ_LENGTH", "128")),
         )
     
     @property
@@ -107,26 +109,30 @@ class Vehicle(Base):
 
 class EmbeddingService:
     """
-    Embedding service using HuggingFace models.
+    Embedding service using sentence-transformers models.
     Replicates the embedding calculation from the main application.
     """
     
-    def __init__(self, model_name: str):
+    def __init__(self, model_name: str, max_seq_length: int):
         self.model_name = model_name
-        logger.info(f"Initializing HuggingFace Embeddings with model: {model_name}")
-        self.model = HuggingFaceEmbeddings(model_name=model_name)
+        logger.info(f"Initializing SentenceTransformer with model: {model_name} (max_seq_length: {max_seq_length})")
+        self.model = SentenceTransformer(model_name)
+        # Same truncation as the main application, so stored and query
+        # embeddings of long descriptions are computed from the same tokens
+        self.model.max_seq_length = max_seq_length
     
     def calculate_embedding(self, text: str) -> list[float]:
         """Calculate embedding for a single text string."""
         if not text:
             return []
-        return self.model.embed_query(text)
+        # L2-normalized like the main application, so stored vectors have unit length
+        return self.model.encode(text, normalize_embeddings=True).tolist()
     
     def calculate_embeddings_batch(self, texts: list[str]) -> list[list[float]]:
         """Calculate embeddings for multiple texts in batch."""
         if not texts:
             return []
-        return self.model.embed_documents(texts)
+        return self.model.encode(texts, normalize_embeddings=True).tolist()
 
 
 class VectorRepository:
@@ -391,7 +397,7 @@ def main():
     # Populate Vector Database
     if not args.skip_vectors:
         logger.info("Initializing embedding service...")
-        embedding_service = EmbeddingService(config.embedding_model)
+        embedding_service = EmbeddingService(config.embedding_model, config.embedding_max_seq_length)
         
         logger.info("Initializing vector repository...")
         vector_repo = VectorRepository(
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from app.services.cached_embedding_service import CachedEmbeddingService
+from app.services.embedding_service import EmbeddingService
+
+
+class FakeModel:
+    def __init__(self):
+        self.calls: list[str | list[str]] = []
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return 3
+
+    def encode(self, sentences, **kwargs) -> np.ndarray:
+        self.calls.append(sentences)
+        if isinstance(sentences, str):
+            return self._embed(sentences)
+        return np.stack([self._embed(sentence) for sentence in sentences])
+
+    def _embed(self, sentence: str) -> np.ndarray:
+        return np.array([len(sentence), ord(sentence[0]), 1.0], dtype=np.float32)
+
+
+@pytest.fixture
+def fake_model(monkeypatch) -> FakeModel:
+    model = FakeModel()
+    monkeypatch.setattr(EmbeddingService, "_configure_torch", lambda self: None)
+    monkeypatch.setattr(EmbeddingService, "_initialize_model", lambda self: model)
+    return model
+
+
+def test_embed_documents_sends_each_distinct_miss_once(fake_model):
+    service = CachedEmbeddingService()
+
+    embeddings = service.embed_documents(["audi", "bmw", "audi"])
+
+    assert fake_model.calls == [["audi", "bmw"]]
+    np.testing.assert_array_equal(embeddings, np.stack([
+        fake_model._embed("audi"),
+        fake_model._embed("bmw"),
+        fake_model._embed("audi"),
+    ]))
+
+
+def test_embed_documents_mixes_hits_and_misses_in_input_order(fake_model):
+    service = CachedEmbeddingService()
+    service.embed_documents(["audi", "bmw"])
+
+    embeddings = service.embed_documents(["chevrolet", "bmw", "dodge", "audi"])
+
+    assert fake_model.calls[-1] == ["chevrolet", "dodge"]
+    assert embeddings.dtype == np.float32
+    np.testing.assert_array_equal(embeddings, np.stack([
+        fake_model._embed("chevrolet"),
+        fake_model._embed("bmw"),
+        fake_model._embed("dodge"),
+        fake_model._embed("audi"),
+    ]))
+
+
+def test_calculate_embedding_reuses_batch_results(fake_model):
+    service = CachedEmbeddingService()
+    service.embed_documents(["audi"])
+
+    embedding = service.calculate_embedding("audi")
+
+    assert fake_model.calls == [["audi"]]
+    np.testing.assert_array_equal(embedding, fake_model._embed("audi"))
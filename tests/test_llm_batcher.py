@@ -0,0 +1,40 @@
+import asyncio
+
+from app.services.llm_batcher import LLMBatcher
+from app.services.llm_service import VehicleMatchingResponse, VehicleOption
+
+
+class FakeLLMService:
+    def __init__(self):
+        self.calls: list[list[tuple[str, list[VehicleOption]]]] = []
+
+    async def match_vehicles_bulk(
+        self,
+        tasks: list[tuple[str, list[VehicleOption]]]
+    ) -> list[VehicleMatchingResponse]:
+        self.calls.append(tasks)
+        return [
+            VehicleMatchingResponse(selected_id=options[0].id, confidence=1.0, reasoning="first option")
+            for _, options in tasks
+        ]
+
+
+def test_submit_then_stop_resolves_request_being_collected():
+    llm_service = FakeLLMService()
+
+    async def scenario() -> VehicleMatchingResponse:
+        # Long wait so the worker is still collecting the batch when stopped
+        batcher = LLMBatcher(lambda: llm_service, max_batch=16, max_wait_ms=10_000)
+        await batcher.start()
+        submitted = asyncio.create_task(batcher.submit(
+            "Toyota Corolla 2024",
+            [VehicleOption(id="TC-401", description="TOYOTA COROLLA 2024")]
+        ))
+        await asyncio.sleep(0.05)
+        await batcher.stop()
+        return await asyncio.wait_for(submitted, 1)
+
+    response = asyncio.run(scenario())
+
+    assert response.selected_id == "TC-401"
+    assert len(llm_service.calls) == 1
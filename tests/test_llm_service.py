@@ -0,0 +1,97 @@
+import asyncio
+
+from app.services.llm_service import (
+    BulkVehicleMatchingItem,
+    BulkVehicleMatchingResponse,
+    LLMService,
+    VehicleMatchingResponse,
+    VehicleOption,
+)
+
+
+class FakeStructuredLLM:
+    def __init__(self, response):
+        self.response = response
+        self.calls: list[list] = []
+
+    async def ainvoke(self, messages):
+        self.calls.append(messages)
+        return self.response
+
+
+def make_llm_service(
+    bulk_results: list[BulkVehicleMatchingItem],
+    single_response: VehicleMatchingResponse | None = None
+) -> LLMService:
+    # Skip __init__, which needs Gemini credentials
+    llm_service = LLMService.__new__(LLMService)
+    llm_service.structured_bulk_llm = FakeStructuredLLM(BulkVehicleMatchingResponse(results=bulk_results))
+    llm_service.structured_llm = FakeStructuredLLM(single_response)
+    return llm_service
+
+
+def result(task_index: int, selected_id: str | None) -> BulkVehicleMatchingItem:
+    return BulkVehicleMatchingItem(task_index=task_index, selected_id=selected_id, confidence=0.9, reasoning="match")
+
+
+def options(*ids: str) -> list[VehicleOption]:
+    return [VehicleOption(id=id_, description=f"vehicle {id_}") for id_ in ids]
+
+
+def prompt(fake_llm: FakeStructuredLLM) -> str:
+    [messages] = fake_llm.calls
+    return messages[-1].content
+
+
+def test_results_are_mapped_back_by_task_index():
+    llm_service = make_llm_service([result(1, "B-2"), result(0, "A-1")])
+
+    responses = asyncio.run(llm_service.match_vehicles_bulk([
+        ("Renault Megane 2009", options("A-1", "A-2")),
+        ("Toyota Corolla 2024", options("B-1", "B-2")),
+    ]))
+
+    assert [r.selected_id for r in responses] == ["A-1", "B-2"]
+
+
+def test_out_of_range_and_repeated_indexes_are_ignored():
+    llm_service = make_llm_service([result(0, "A-1"), result(0, "A-2"), result(7, "X-1")])
+
+    responses = asyncio.run(llm_service.match_vehicles_bulk([
+        ("Renault Megane 2009", options("A-1", "A-2")),
+        ("Toyota Corolla 2024", options("B-1", "B-2")),
+    ]))
+
+    assert responses[0].selected_id == "A-1"
+    # No result for task 1, so it falls back to "no match"
+    assert responses[1].selected_id is None
+    assert responses[1].confidence == 0.0
+    assert responses[1].reasoning == "The LLM did not return a result for this task."
+
+
+def test_identical_tasks_are_sent_once():
+    llm_service = make_llm_service([result(0, "A-1"), result(1, "B-1")])
+
+    responses = asyncio.run(llm_service.match_vehicles_bulk([
+        ("Renault Megane 2009", options("A-1", "A-2")),
+        ("Toyota Corolla 2024", options("B-1", "B-2")),
+        ("Renault Megane 2009", options("A-1", "A-2")),
+    ]))
+
+    assert prompt(llm_service.structured_bulk_llm).count("### TAREA") == 2
+    assert [r.selected_id for r in responses] == ["A-1", "B-1", "A-1"]
+
+
+def test_single_pending_task_uses_the_single_match_prompt():
+    single_response = VehicleMatchingResponse(selected_id="A-2", confidence=0.8, reasoning="match")
+    llm_service = make_llm_service([], single_response)
+
+    responses = asyncio.run(llm_service.match_vehicles_bulk([
+        ("Renault Megane 2009", options("A-1", "A-2")),
+        ("Toyota Corolla 2024", []),
+    ]))
+
+    assert responses[0] == single_response
+    assert responses[1].selected_id is None
+    assert llm_service.structured_bulk_llm.calls == []
+    assert len(llm_service.structured_llm.calls) == 1